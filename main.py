@@ -1,8 +1,10 @@
 ## main.py
 from routers import analyze_repo_router
-from fastapi import FastAPI
+from fastapi import FastAPI, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from routers import generate_doc_router
+from services.generate_doc_service import get_mistral_client
+from services.repo_analysis_service import load_git
 
 app = FastAPI()
 
@@ -13,8 +15,27 @@ app.add_middleware(
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
 )
+_warm_up_scheduled = False
+
+def warm_up():
+    """
+    Pulls in the heavy libraries (GitPython, mistralai) and builds the shared client
+    so the first real request doesn't pay for it. Each step is tried independently;
+    a failure is only logged and left for the first request that needs it to raise.
+    """
+    for step in (load_git, get_mistral_client):
+        try:
+            step()
+        except Exception as e:
+            print(f"Warm up step {step.__name__} failed: {str(e)}")
+
 @app.get("/health")
-async def health_checking():
+async def health_checking(background_tasks: BackgroundTasks):
+    global _warm_up_scheduled
+    # runs once, after the first response is sent, so the health check itself stays fast
+    if not _warm_up_scheduled:
+        _warm_up_scheduled = True
+        background_tasks.add_task(warm_up)
     return {"status": "ok", "message": "Service is up and running"}
     
 @app.get("/", tags=["Health"])
@@ -2,20 +2,52 @@ import os
 import json
 import time
 import re
-from mistralai.client import Mistral
+import threading
+from functools import lru_cache
 from services.repo_analysis_service import MultiLanguageApiAnalyzerService
-from dotenv import load_dotenv
-load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def load_env():
+    """
+    Loads the .env file once. dotenv is imported here so it stays off the startup path.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+_mistral_client = None
+_mistral_client_lock = threading.Lock()
+
+def get_mistral_client():
+    """
+    Builds the shared Mistral client on first use. mistralai is slow to import,
+    so it is only pulled in by the first request (or the background warm up).
+    The lock keeps a request racing the warm up from building a second client.
+    """
+    global _mistral_client
+    if _mistral_client is None:
+        with _mistral_client_lock:
+            if _mistral_client is None:
+                from mistralai.client import Mistral
+                load_env()
+                api_key = os.getenv("MISTRAL_API_KEY") # or hardcode your key here
+                _mistral_client = Mistral(api_key=api_key)
+    return _mistral_client
+
 
 class ApiDocService:
 
     def __init__(self):
-        api_key = os.getenv("MISTRAL_API_KEY") # or hardcode your key here
-        self.client = Mistral(api_key=api_key)
+        load_env()
 
         env_model = os.getenv("MISTRAL_MODEL")
         self.model = env_model if env_model is not None else "mistral-small-latest"
-        print("api key : ",api_key,"\nenv_model : ",env_model)
+        print("api key set : ",bool(os.getenv("MISTRAL_API_KEY")),"\nenv_model : ",env_model)
+
+    @property
+    def client(self):
+        return get_mistral_client()
 
     def _summarize_files(self, file_paths: list[str], language: str ) -> list[dict]:
         aggregated = []
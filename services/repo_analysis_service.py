@@ -1,12 +1,22 @@
 # git_clone_service.py
-from git import Repo, GitCommandError
 from pathlib import Path
+from functools import lru_cache
 
 import os
 import re
 from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse
 
+
+@lru_cache(maxsize=None)
+def load_git():
+    """
+    Imports GitPython on first use. It is slow to import and only needed for cloning.
+    """
+    import git
+    return git
+
+
 class GitCloneService:
     def __init__(self, base_folder: str = "data"):
         self.base_folder = Path(__file__).parent / base_folder
@@ -33,20 +43,21 @@ class GitCloneService:
           - commit_sha: str
         Raises RuntimeError on failure.
         """
+        git = load_git()
         repo_name = GitCloneService.get_repo_name(repo_url)
         dest = self.base_folder / repo_name
 
         try:
             if dest.exists():
-                repo = Repo(str(dest))
+                repo = git.Repo(str(dest))
                 sha = repo.head.commit.hexsha
                 return {"repo_path": str(dest), "commit_sha": sha}
 
-            repo = Repo.clone_from(repo_url, str(dest))
+            repo = git.Repo.clone_from(repo_url, str(dest))
             sha = repo.head.commit.hexsha
             return {"repo_path": str(dest), "commit_sha": sha}
 
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             raise RuntimeError(f"Clone failed: {e}")
 
 class MultiLanguageApiAnalyzerService:
@@ -55,30 +66,30 @@ class MultiLanguageApiAnalyzerService:
     across C#, Java, Node.js, and Python ecosystems.
     """
     
-    def __init__(self):
-        # Programming language file extension mappings
-        self.language_extensions = {
-            'C#': ['.cs', '.csx'],
-            'Python': ['.py', '.pyw', '.pyi'],
-            'JavaScript': ['.js', '.jsx', '.mjs', '.cjs'],
-            'TypeScript': ['.ts', '.tsx'],
-            'Java': ['.java'],
-            'JSON': ['.json'],
-            'XML': ['.xml', '.xaml', '.xsd'],
-            'YAML': ['.yaml', '.yml'],
-            'HTML': ['.html', '.htm'],
-            'CSS': ['.css', '.scss', '.sass', '.less'],
-        }
-        
-        # Reverse mapping for quick lookup
-        self.extension_to_language = {}
-
-        for language, extensions in self.language_extensions.items():
-            for ext in extensions:
-                if ext not in self.extension_to_language:
-                    self.extension_to_language[ext] = []
-                self.extension_to_language[ext].append(language)
-        
+    # Programming language file extension mappings
+    language_extensions = {
+        'C#': ['.cs', '.csx'],
+        'Python': ['.py', '.pyw', '.pyi'],
+        'JavaScript': ['.js', '.jsx', '.mjs', '.cjs'],
+        'TypeScript': ['.ts', '.tsx'],
+        'Java': ['.java'],
+        'JSON': ['.json'],
+        'XML': ['.xml', '.xaml', '.xsd'],
+        'YAML': ['.yaml', '.yml'],
+        'HTML': ['.html', '.htm'],
+        'CSS': ['.css', '.scss', '.sass', '.less'],
+    }
+
+    # Reverse mapping for quick lookup, built once for all instances
+    extension_to_language = {}
+
+    for language, extensions in language_extensions.items():
+        for ext in extensions:
+            if ext not in extension_to_language:
+                extension_to_language[ext] = []
+            extension_to_language[ext].append(language)
+    del language, extensions, ext
+
     def detect_language_from_extensions(self, directory_path: str) -> Dict[str, List[str]]:
         """
         Function 1: Detect programming languages used in a directory based on file extensions.
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# the app uses top level imports (routers, services, models), so run from the repo root
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
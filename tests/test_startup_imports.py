@@ -0,0 +1,52 @@
+import json
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+
+import main
+from conftest import ROOT_DIR
+
+# modules that must stay off the startup path, they are loaded lazily or by warm_up
+HEAVY_MODULES = ["git", "mistralai", "dotenv"]
+
+# loose bound on importing the app, it only has to catch something heavy sneaking back in
+IMPORT_TIME_BUDGET_SECONDS = 5.0
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def test_import_main_skips_heavy_modules():
+    # fresh interpreter so sys.modules isn't polluted by other tests
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["loaded"] == []
+    assert report["elapsed"] < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_health_schedules_warm_up_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "warm_up", lambda: calls.append("warm_up"))
+    monkeypatch.setattr(main, "_warm_up_scheduled", False)
+    client = TestClient(main.app)
+
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+    assert calls == ["warm_up"]
+
+    client.get("/health")
+    assert calls == ["warm_up"]